@@ -2,22 +2,34 @@
 LangGraph-based multi-agent orchestration for PM High Council's Quad-Swarm Engine.
 """
 
-import json
-from typing import TypedDict, Optional
-
-from langchain_openai import ChatOpenAI
+import asyncio
+import functools
+import hashlib
+import re
+import threading
+from typing import TypedDict, Optional, List
+
+import orjson
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
+from pydantic import BaseModel
 
 from config import (
     SUPERVISOR_PROMPT,
     SYNTHESIZER_PROMPT,
-    LLM_MODEL,
+    SUPERVISOR_LLM_MODEL,
+    SWARM_LLM_MODEL,
+    SYNTHESIZER_LLM_MODEL,
+    EMBEDDING_MODEL,
     OPENAI_API_KEY,
     SWARMS,
 )
-from agents.base_agent import create_swarm_agent
+from agents.base_agent import create_swarm_agent, get_persona_index
+from cache import kv_cache
+from http_clients import http_client, http_async_client
 
 
 # State schema for the Quad-Swarm graph
@@ -29,6 +41,11 @@ class CouncilState(TypedDict):
     product_swarm_query: Optional[str]
     growth_swarm_query: Optional[str]
     engineering_swarm_query: Optional[str]
+    # Swarm query embeddings
+    founder_swarm_embedding: Optional[List[float]]
+    product_swarm_embedding: Optional[List[float]]
+    growth_swarm_embedding: Optional[List[float]]
+    engineering_swarm_embedding: Optional[List[float]]
     # Swarm responses
     founder_swarm_response: Optional[dict]
     product_swarm_response: Optional[dict]
@@ -38,48 +55,87 @@ class CouncilState(TypedDict):
     synthesis: Optional[str]
 
 
+class SwarmQueries(BaseModel):
+    """Focused queries the supervisor writes for each swarm."""
+    founder_swarm_query: str
+    product_swarm_query: str
+    growth_swarm_query: str
+    engineering_swarm_query: str
+
+
 # List of swarm names for iteration
 SWARM_NAMES = ["founder_swarm", "product_swarm", "growth_swarm", "engineering_swarm"]
 
 
-# Initialize LLM for supervisor and synthesizer
-llm = ChatOpenAI(
-    model=LLM_MODEL,
+# Initialize LLMs for supervisor and synthesizer
+supervisor_llm = ChatOpenAI(
+    model=SUPERVISOR_LLM_MODEL,
+    openai_api_key=OPENAI_API_KEY,
+    temperature=0.0,
+    http_client=http_client,
+    http_async_client=http_async_client
+)
+
+synthesizer_llm = ChatOpenAI(
+    model=SYNTHESIZER_LLM_MODEL,
+    openai_api_key=OPENAI_API_KEY,
+    temperature=0.7,
+    http_client=http_client,
+    http_async_client=http_async_client
+)
+
+# Embeddings for batching the swarm queries
+embeddings = OpenAIEmbeddings(
+    model=EMBEDDING_MODEL,
     openai_api_key=OPENAI_API_KEY,
-    temperature=0.7
+    http_client=http_client,
+    http_async_client=http_async_client
 )
 
+# Chains are composed once at import rather than on every node call.
+# Structured output guarantees a valid SwarmQueries, so no JSON parsing.
+_SUPERVISOR_CHAIN = ChatPromptTemplate.from_messages([
+    ("system", SUPERVISOR_PROMPT),
+    ("human", "Product Problem: {problem}")
+]) | supervisor_llm.with_structured_output(SwarmQueries)
 
-def supervisor_node(state: CouncilState) -> dict:
+# Tagged so stream_council can forward the synthesizer's tokens
+_SYNTHESIZER_CHAIN = (
+    ChatPromptTemplate.from_messages([
+        ("system", "You are a strategic advisor synthesizing multiple perspectives from expert collectives."),
+        ("human", SYNTHESIZER_PROMPT)
+    ])
+    | synthesizer_llm
+    | StrOutputParser()
+).with_config(tags=["synthesizer"])
+
+
+@kv_cache("supervisor", SUPERVISOR_PROMPT, SUPERVISOR_LLM_MODEL)
+async def _generate_queries(problem: str) -> dict:
+    """Run the supervisor LLM for a problem (cached on exact match)."""
+    queries = await _SUPERVISOR_CHAIN.ainvoke({"problem": problem})
+
+    return queries.model_dump()
+
+
+async def supervisor_node(state: CouncilState) -> dict:
     """
     Supervisor node that analyzes the problem and creates focused queries for each swarm.
     """
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SUPERVISOR_PROMPT),
-        ("human", "Product Problem: {problem}")
-    ])
+    return await _generate_queries(state["problem"])
 
-    chain = prompt | llm | StrOutputParser()
 
-    response = chain.invoke({"problem": state["problem"]})
+async def embed_queries_node(state: CouncilState) -> dict:
+    """
+    Embed all four swarm queries in a single batched request.
+    """
+    queries = [state.get(f"{swarm_name}_query") or state["problem"] for swarm_name in SWARM_NAMES]
 
-    # Parse JSON response
-    try:
-        queries = json.loads(response)
-    except json.JSONDecodeError:
-        # Fallback: use the problem directly with swarm-specific framing
-        queries = {
-            "founder_swarm_query": f"From a founder's perspective on vision and culture, how would you approach: {state['problem']}",
-            "product_swarm_query": f"What product strategy and discovery process would you recommend for: {state['problem']}",
-            "growth_swarm_query": f"What growth systems, metrics and loops should we focus on for: {state['problem']}",
-            "engineering_swarm_query": f"What are the technical considerations and feasibility concerns for: {state['problem']}"
-        }
+    vectors = await embeddings.aembed_documents(queries)
 
     return {
-        "founder_swarm_query": queries.get("founder_swarm_query", ""),
-        "product_swarm_query": queries.get("product_swarm_query", ""),
-        "growth_swarm_query": queries.get("growth_swarm_query", ""),
-        "engineering_swarm_query": queries.get("engineering_swarm_query", "")
+        f"{swarm_name}_embedding": vector
+        for swarm_name, vector in zip(SWARM_NAMES, vectors)
     }
 
 
@@ -94,35 +150,98 @@ def create_swarm_node(swarm_name: str):
         display_name=config["display_name"]
     )
 
-    def node(state: CouncilState) -> dict:
+    async def node(state: CouncilState) -> dict:
         query_key = f"{swarm_name}_query"
+        embedding_key = f"{swarm_name}_embedding"
         response_key = f"{swarm_name}_response"
 
-        query = state.get(query_key, state["problem"])
-        result = agent(query)
+        query = state.get(query_key) or state["problem"]
+        result = await agent(query, state.get(embedding_key))
 
         return {response_key: result}
 
     return node
 
 
-def synthesizer_node(state: CouncilState) -> dict:
+@kv_cache("synthesizer", SYNTHESIZER_PROMPT, SYNTHESIZER_LLM_MODEL)
+async def _synthesize(
+    founder_swarm_response: str,
+    product_swarm_response: str,
+    growth_swarm_response: str,
+    engineering_swarm_response: str,
+    config: Optional[RunnableConfig] = None
+) -> str:
+    """
+    Run the synthesizer LLM over the four swarm responses (cached on exact match).
+
+    config carries the graph's callbacks to the chain, so astream_events sees
+    the synthesizer's tokens; it is not part of the cache key.
+    """
+    return await _SYNTHESIZER_CHAIN.ainvoke({
+        "founder_swarm_response": founder_swarm_response,
+        "product_swarm_response": product_swarm_response,
+        "growth_swarm_response": growth_swarm_response,
+        "engineering_swarm_response": engineering_swarm_response
+    }, config=config)
+
+
+# Sentence boundaries, capturing the following whitespace so text can be rebuilt
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])(\s+)")
+
+# Shorter sentences (e.g. the "🎯 High confidence" marker) are never deduplicated
+_MIN_DEDUP_SENTENCE_LEN = 40
+
+
+def _get_or_default(state: CouncilState, key: str, missing_msg: str) -> str:
+    """Return a swarm's response text from state, or a placeholder if it is missing."""
+    value = state.get(key)
+    return value["response"] if value else missing_msg
+
+
+def _dedupe_sentences(texts: List[str]) -> List[str]:
+    """
+    Drop sentences that already appeared verbatim in an earlier swarm's response.
+
+    Saves synthesizer input tokens when swarms repeat the same generic advice;
+    repeats within a single response are left alone.
+    """
+    seen = set()
+    deduped = []
+
+    for text in texts:
+        parts = _SENTENCE_SPLIT_RE.split(text)
+        kept = []
+        sentences = set()
+
+        # parts alternates sentence, whitespace, sentence, ...
+        for sentence, separator in zip(parts[::2], parts[1::2] + [""]):
+            key = sentence.strip()
+            if len(key) >= _MIN_DEDUP_SENTENCE_LEN:
+                if key in seen:
+                    continue
+                sentences.add(key)
+            kept.append(sentence + separator)
+
+        seen |= sentences
+        deduped.append("".join(kept).strip())
+
+    return deduped
+
+
+async def synthesizer_node(state: CouncilState, config: RunnableConfig) -> dict:
     """
     Synthesizer node that combines all swarm responses into actionable guidance.
+
+    The node's config is passed through explicitly: before Python 3.11, async
+    LangChain calls don't inherit callbacks from context, and without them no
+    synthesis_token events are streamed.
     """
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a strategic advisor synthesizing multiple perspectives from expert collectives."),
-        ("human", SYNTHESIZER_PROMPT)
+    swarm_texts = _dedupe_sentences([
+        _get_or_default(state, f"{swarm_name}_response", f"No response from {SWARMS[swarm_name]['display_name']}")
+        for swarm_name in SWARM_NAMES
     ])
 
-    chain = prompt | llm | StrOutputParser()
-
-    response = chain.invoke({
-        "founder_swarm_response": state["founder_swarm_response"]["response"] if state.get("founder_swarm_response") else "No response from The Visionary",
-        "product_swarm_response": state["product_swarm_response"]["response"] if state.get("product_swarm_response") else "No response from The Scaler",
-        "growth_swarm_response": state["growth_swarm_response"]["response"] if state.get("growth_swarm_response") else "No response from The Scientist",
-        "engineering_swarm_response": state["engineering_swarm_response"]["response"] if state.get("engineering_swarm_response") else "No response from The Architect"
-    })
+    response = await _synthesize(*swarm_texts, config=config)
 
     return {"synthesis": response}
 
@@ -135,6 +254,7 @@ def build_council_graph() -> StateGraph:
 
     # Add nodes
     graph.add_node("supervisor", supervisor_node)
+    graph.add_node("embed_queries", embed_queries_node)
     graph.add_node("founder_swarm", create_swarm_node("founder_swarm"))
     graph.add_node("product_swarm", create_swarm_node("product_swarm"))
     graph.add_node("growth_swarm", create_swarm_node("growth_swarm"))
@@ -144,9 +264,12 @@ def build_council_graph() -> StateGraph:
     # Set entry point
     graph.set_entry_point("supervisor")
 
-    # Add edges: supervisor -> all swarms in parallel
+    # Supervisor -> batched query embedding
+    graph.add_edge("supervisor", "embed_queries")
+
+    # Add edges: embed_queries -> all swarms in parallel (async nodes overlap on I/O)
     for swarm_name in SWARM_NAMES:
-        graph.add_edge("supervisor", swarm_name)
+        graph.add_edge("embed_queries", swarm_name)
 
     # All swarms -> synthesizer
     for swarm_name in SWARM_NAMES:
@@ -158,21 +281,32 @@ def build_council_graph() -> StateGraph:
     return graph.compile()
 
 
-# Compile the graph for use
-council_graph = build_council_graph()
+@functools.cache
+def get_council_graph():
+    """Build the council graph on first use, so importing this module stays cheap."""
+    return build_council_graph()
 
 
-def invoke_council(problem: str) -> dict:
-    """
-    Convenience function to invoke the council with a problem statement.
+@functools.cache
+def get_corpus_digest() -> str:
+    """Digest of every swarm's indexed corpus, so cached council results expire on re-ingest."""
+    return hashlib.sha256(
+        "\x00".join(get_persona_index(swarm_name).fingerprint() for swarm_name in SWARM_NAMES).encode("utf-8")
+    ).hexdigest()
 
-    Args:
-        problem: The product problem to discuss
 
-    Returns:
-        Dict with swarm responses and synthesis
-    """
-    result = council_graph.invoke({"problem": problem})
+@kv_cache(
+    "council",
+    SUPERVISOR_PROMPT,
+    SYNTHESIZER_PROMPT,
+    SUPERVISOR_LLM_MODEL,
+    SWARM_LLM_MODEL,
+    SYNTHESIZER_LLM_MODEL,
+    *(config["system_prompt"] for config in SWARMS.values())
+)
+async def _ainvoke_council(problem: str, corpus_digest: str) -> dict:
+    """Run the council graph (cached on exact problem match under the same corpus)."""
+    result = await get_council_graph().ainvoke({"problem": problem})
 
     return {
         "problem": result["problem"],
@@ -184,6 +318,42 @@ def invoke_council(problem: str) -> dict:
     }
 
 
+async def ainvoke_council(problem: str) -> dict:
+    """
+    Invoke the council with a problem statement.
+
+    Full results are cached on exact (normalized) problem match, so a
+    repeated problem skips the supervisor, swarms and synthesizer entirely.
+    The corpus digest is part of the key, so a re-ingest invalidates them.
+
+    Args:
+        problem: The product problem to discuss
+
+    Returns:
+        Dict with swarm responses and synthesis
+    """
+    return await _ainvoke_council(problem, get_corpus_digest())
+
+
+@functools.cache
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Start the long-lived background event loop that invoke_council runs on."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="council-sync-loop", daemon=True).start()
+    return loop
+
+
+def invoke_council(problem: str) -> dict:
+    """
+    Synchronous wrapper around ainvoke_council for scripts.
+
+    Every call runs on the same background event loop, since the shared async
+    HTTP and Redis clients stay bound to the loop that first used them; a new
+    loop per call (asyncio.run) would break every call after the first.
+    """
+    return asyncio.run_coroutine_threadsafe(ainvoke_council(problem), _get_sync_loop()).result()
+
+
 async def stream_council(problem: str):
     """
     Async generator that yields events as the council processes the problem.
@@ -192,7 +362,7 @@ async def stream_council(problem: str):
     """
     config = {"recursion_limit": 50}
 
-    async for event in council_graph.astream_events(
+    async for event in get_council_graph().astream_events(
         {"problem": problem},
         config=config,
         version="v2"
@@ -210,6 +380,15 @@ async def stream_council(problem: str):
                 }
             }
 
+        # Stream synthesizer tokens as they are generated
+        elif kind == "on_chat_model_stream" and "synthesizer" in event.get("tags", []):
+            token = event["data"]["chunk"].content
+            if token:
+                yield {
+                    "event": "synthesis_token",
+                    "data": {"token": token}
+                }
+
         # Handle swarm completion events
         elif kind == "on_chain_end":
             if name in SWARM_NAMES:
@@ -236,4 +415,4 @@ async def stream_council(problem: str):
 if __name__ == "__main__":
     # Test the graph
     result = invoke_council("High churn during user onboarding")
-    print(json.dumps(result, indent=2, default=str))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode())
@@ -2,7 +2,8 @@
 Base RAG agent for PM High Council swarms.
 """
 
-from typing import Callable
+import functools
+from typing import Awaitable, Callable, List, Optional
 
 import chromadb
 from chromadb.config import Settings
@@ -10,20 +11,64 @@ from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from cache import SemanticCache, semantic_cache
+from http_clients import http_client, http_async_client
+from persona_mapping import get_display_name_from_speaker
+from .persona_index import PersonaIndex, load_persona_index
 from config import (
     CHROMA_DB_DIR,
-    COLLECTION_NAME,
+    COLLECTION_PREFIX,
     EMBEDDING_MODEL,
-    LLM_MODEL,
+    SWARM_LLM_MODEL,
     OPENAI_API_KEY,
 )
 
 
+@functools.cache
+def _get_client():
+    """Open the shared ChromaDB client on first use."""
+    return chromadb.PersistentClient(
+        path=str(CHROMA_DB_DIR),
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+
+def _get_collection(persona_type: str):
+    """Return the ChromaDB collection holding a persona swarm's chunks."""
+    return _get_client().get_collection(f"{COLLECTION_PREFIX}{persona_type}")
+
+
+# Shared across all swarm agents: one embeddings client and one LLM
+# instead of one of each per swarm
+_embeddings = OpenAIEmbeddings(
+    model=EMBEDDING_MODEL,
+    openai_api_key=OPENAI_API_KEY,
+    http_client=http_client,
+    http_async_client=http_async_client
+)
+
+_llm = ChatOpenAI(
+    model=SWARM_LLM_MODEL,
+    openai_api_key=OPENAI_API_KEY,
+    temperature=0.7,
+    http_client=http_client,
+    http_async_client=http_async_client
+)
+
+
+@functools.cache
+def get_persona_index(persona_type: str) -> PersonaIndex:
+    """Load and warm a swarm's HNSW index once per process (built from ChromaDB on first run)."""
+    index = load_persona_index(persona_type, _get_collection)
+    index.warm_up()
+    return index
+
+
 def create_swarm_agent(
     persona_type: str,
     system_prompt: str,
     display_name: str
-) -> Callable[[str], dict]:
+) -> Callable[..., Awaitable[dict]]:
     """
     Create a RAG-enabled swarm agent that retrieves context from a collective of speakers.
 
@@ -33,27 +78,15 @@ def create_swarm_agent(
         display_name: Human-readable name for the swarm (e.g., "The Visionary")
 
     Returns:
-        A callable that takes a query and returns a response with sources
+        An async callable that takes a query (and optionally its precomputed
+        embedding) and returns a response with sources
     """
 
-    # Initialize ChromaDB client
-    client = chromadb.PersistentClient(
-        path=str(CHROMA_DB_DIR),
-        settings=Settings(anonymized_telemetry=False)
-    )
-    collection = client.get_collection(COLLECTION_NAME)
+    # Load this swarm's in-process HNSW index
+    index = get_persona_index(persona_type)
 
-    # Initialize embeddings and LLM
-    embeddings = OpenAIEmbeddings(
-        model=EMBEDDING_MODEL,
-        openai_api_key=OPENAI_API_KEY
-    )
-
-    llm = ChatOpenAI(
-        model=LLM_MODEL,
-        openai_api_key=OPENAI_API_KEY,
-        temperature=0.7
-    )
+    # Cached answers are only reused under the same prompt, model and corpus
+    cache_namespace = SemanticCache.namespace(persona_type, system_prompt, SWARM_LLM_MODEL, index.fingerprint())
 
     # Create prompt template
     prompt = ChatPromptTemplate.from_messages([
@@ -62,66 +95,79 @@ def create_swarm_agent(
     ])
 
     # Create chain
-    chain = prompt | llm | StrOutputParser()
+    chain = prompt | _llm | StrOutputParser()
 
-    def invoke(query: str) -> dict:
+    async def ainvoke(query: str, precomputed_embedding: Optional[List[float]] = None) -> dict:
         """
         Invoke the swarm agent with a query.
 
         Args:
             query: The user's question
+            precomputed_embedding: Embedding of the query, if already computed
 
         Returns:
             Dict with 'response', 'sources', and 'agent' keys
         """
-        # Generate query embedding
-        query_embedding = embeddings.embed_query(query)
-
-        # Retrieve relevant chunks filtered by persona swarm
-        results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=8,  # Increased to get diverse perspectives from swarm
-            where={"persona": persona_type},
-            include=["documents", "metadatas"]
+        # Generate query embedding unless the graph already batched it
+        if precomputed_embedding is not None:
+            query_embedding = precomputed_embedding
+        else:
+            query_embedding = await _embeddings.aembed_query(query)
+
+        # Short-circuit on a semantically similar past query
+        if semantic_cache is not None:
+            hit = await semantic_cache.search(cache_namespace, query_embedding)
+            if hit is not None:
+                return hit
+
+        # Retrieve relevant chunks from the persona swarm's index
+        documents, metadatas = index.query(
+            query_embedding,
+            k=8  # Increased to get diverse perspectives from swarm
         )
 
-        # Format context with attribution to individual speakers
-        context_parts = []
-        sources = []
-
-        if results["documents"] and results["documents"][0]:
-            for doc, meta in zip(results["documents"][0], results["metadatas"][0]):
-                speaker_name = meta.get("speaker_name", "Unknown")
-                display_speaker = " ".join(word.capitalize() for word in speaker_name.split("-"))
-                timestamp = meta.get("timestamp", "N/A")
-
-                context_parts.append(f"[{display_speaker} - {timestamp}] {doc}")
-                sources.append({
-                    "text": doc[:200] + "..." if len(doc) > 200 else doc,
-                    "speaker": display_speaker,
-                    "episode": meta.get("episode_title", "Unknown"),
-                    "timestamp": timestamp
-                })
+        # Project the metadata columns once, then build context and sources
+        display_speakers = [get_display_name_from_speaker(meta.get("speaker_name", "Unknown")) for meta in metadatas]
+        timestamps = [meta.get("timestamp", "N/A") for meta in metadatas]
 
-        context = "\n\n".join(context_parts) if context_parts else "No relevant context found from this collective."
+        # Format context with attribution to individual speakers
+        context = "\n\n".join(
+            f"[{speaker} - {timestamp}] {doc}"
+            for speaker, timestamp, doc in zip(display_speakers, timestamps, documents)
+        ) or "No relevant context found from this collective."
+
+        sources = [
+            {
+                "text": meta.get("preview") or (doc[:200] + "..." if len(doc) > 200 else doc),
+                "speaker": speaker,
+                "episode": meta.get("episode_title", "Unknown"),
+                "timestamp": timestamp
+            }
+            for doc, meta, speaker, timestamp in zip(documents, metadatas, display_speakers, timestamps)
+        ]
 
         # Generate response
-        response = chain.invoke({
+        response = await chain.ainvoke({
             "context": context,
             "query": query
         })
 
-        return {
+        result = {
             "response": response,
             "sources": sources,
             "agent": display_name
         }
 
-    return invoke
+        if semantic_cache is not None:
+            await semantic_cache.set(cache_namespace, query_embedding, result)
+
+        return result
+
+    return ainvoke
 
 
 # Keep backwards compatibility alias (deprecated)
-def create_rag_agent(speaker_name: str, system_prompt: str, display_name: str) -> Callable[[str], dict]:
+def create_rag_agent(speaker_name: str, system_prompt: str, display_name: str) -> Callable[..., Awaitable[dict]]:
     """
     DEPRECATED: Use create_swarm_agent instead.
     This function is kept for backwards compatibility only.
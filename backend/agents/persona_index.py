@@ -0,0 +1,106 @@
+"""
+In-process HNSW index over one persona swarm's transcript chunks.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, List, Tuple
+
+import hnswlib
+import numpy as np
+
+from config import PERSONA_INDEX_DIR, EMBEDDING_DIM
+
+
+class PersonaIndex:
+    """An hnswlib index plus the documents and metadata it points at."""
+
+    def __init__(self, index: hnswlib.Index, documents: List[str], metadatas: List[dict]):
+        self.index = index
+        self.documents = documents
+        self.metadatas = metadatas
+        self._fingerprint = None
+
+    def query(self, embedding: List[float], k: int) -> Tuple[List[str], List[dict]]:
+        """
+        Find the k nearest chunks to a query embedding.
+
+        Returns:
+            Parallel lists of documents and metadatas, nearest first
+        """
+        count = self.index.get_current_count()
+        if count == 0:
+            return [], []
+
+        labels, _ = self.index.knn_query(np.asarray(embedding, dtype=np.float32), k=min(k, count))
+
+        return (
+            [self.documents[i] for i in labels[0]],
+            [self.metadatas[i] for i in labels[0]]
+        )
+
+    def fingerprint(self) -> str:
+        """Hash of the indexed documents and metadata; changes whenever a re-ingest changes them."""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(
+                json.dumps([self.documents, self.metadatas], sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        return self._fingerprint
+
+    def warm_up(self) -> None:
+        """Run one throwaway query so the first real request doesn't pay first-touch costs."""
+        if self.index.get_current_count():
+            self.index.knn_query(np.asarray(self.index.get_items([0]), dtype=np.float32), k=1)
+
+
+def load_persona_index(persona_type: str, get_collection: Callable) -> PersonaIndex:
+    """
+    Load the persona's HNSW index from disk, building it from ChromaDB if missing.
+
+    Args:
+        persona_type: The swarm identifier (e.g., "founder_swarm")
+        get_collection: Returns the persona's ChromaDB collection; only called
+            when the index has to be built, so ChromaDB is not opened otherwise
+
+    Returns:
+        The PersonaIndex for that swarm
+    """
+    index_path = PERSONA_INDEX_DIR / f"{persona_type}.bin"
+    data_path = PERSONA_INDEX_DIR / f"{persona_type}.json"
+
+    if index_path.exists() and data_path.exists():
+        data = json.loads(data_path.read_text(encoding="utf-8"))
+        index = hnswlib.Index(space="cosine", dim=data["dim"])
+        index.load_index(str(index_path))
+        index.set_ef(50)
+        return PersonaIndex(index, data["documents"], data["metadatas"])
+
+    # Build from the persona's chunks in ChromaDB
+    results = get_collection(persona_type).get(
+        include=["embeddings", "documents", "metadatas"]
+    )
+    vectors = np.asarray(results["embeddings"], dtype=np.float32)
+    dim = vectors.shape[1] if len(vectors) else EMBEDDING_DIM
+
+    index = hnswlib.Index(space="cosine", dim=dim)
+    index.init_index(max_elements=max(len(vectors), 1), ef_construction=200, M=16)
+    if len(vectors):
+        index.add_items(vectors, np.arange(len(vectors)))
+    index.set_ef(50)  # Must be >= k
+
+    # Persist so later startups skip the ChromaDB scan. Write atomically so a
+    # crash or a concurrent worker never leaves a truncated file behind
+    PERSONA_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_index_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_data_path = data_path.with_name(f"{data_path.name}.{os.getpid()}.tmp")
+    index.save_index(str(tmp_index_path))
+    tmp_data_path.write_text(json.dumps({
+        "dim": dim,
+        "documents": results["documents"],
+        "metadatas": results["metadatas"]
+    }), encoding="utf-8")
+    os.replace(tmp_index_path, index_path)
+    os.replace(tmp_data_path, data_path)
+
+    return PersonaIndex(index, results["documents"], results["metadatas"])
@@ -0,0 +1,207 @@
+"""
+Redis-backed caches for PM High Council LLM calls.
+"""
+
+import functools
+import hashlib
+import json
+import uuid
+from array import array
+from typing import Awaitable, Callable, List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from config import (
+    REDIS_URL,
+    EMBEDDING_DIM,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL,
+    KV_CACHE_TTL,
+)
+
+
+class SemanticCache:
+    """
+    Semantic cache of swarm responses keyed on query embeddings.
+
+    Each namespace (a persona swarm plus a digest of its prompt, model and
+    corpus) gets its own RediSearch HNSW index, so a lookup only ever matches
+    past queries answered by the same swarm under the same configuration.
+    """
+
+    def __init__(self, redis: Redis, ttl: int = SEMANTIC_CACHE_TTL):
+        self.redis = redis
+        self.ttl = ttl
+        self._indexed = set()
+
+    @staticmethod
+    def namespace(persona_type: str, *key_parts: str) -> str:
+        """
+        Cache namespace for one swarm (e.g., "founder_swarm:1a2b3c4d5e6f").
+
+        The key parts (e.g. system prompt, model, corpus fingerprint) are hashed
+        into the name, so changing any of them starts a fresh index instead of
+        serving answers produced under the old configuration.
+        """
+        digest = hashlib.sha256("\x00".join(key_parts).encode("utf-8")).hexdigest()[:12]
+        return f"{persona_type}:{digest}"
+
+    @staticmethod
+    def _index_name(namespace: str) -> str:
+        return f"semcache:{namespace}"
+
+    async def _ensure_index(self, namespace: str) -> None:
+        if namespace in self._indexed:
+            return
+
+        index_name = self._index_name(namespace)
+        try:
+            await self.redis.execute_command(
+                "FT.CREATE", index_name,
+                "ON", "HASH",
+                "PREFIX", 1, f"{index_name}:",
+                "SCHEMA",
+                "embedding", "VECTOR", "HNSW", 6,
+                "TYPE", "FLOAT32",
+                "DIM", EMBEDDING_DIM,
+                "DISTANCE_METRIC", "COSINE",
+            )
+        except ResponseError as e:
+            if "already exists" not in str(e).lower():
+                raise
+
+        await self._drop_stale_indexes(namespace)
+        self._indexed.add(namespace)
+
+    async def _drop_stale_indexes(self, namespace: str) -> None:
+        """Drop this swarm's indexes from older namespaces (before a prompt, model or corpus change)."""
+        persona_type = namespace.rsplit(":", 1)[0]
+        current = self._index_name(namespace)
+        legacy = self._index_name(persona_type)  # Pre-digest index name
+
+        for name in await self.redis.execute_command("FT._LIST"):
+            name = name.decode() if isinstance(name, bytes) else name
+            try:
+                if name == legacy:
+                    # Its key prefix also covers the current namespace's keys, so
+                    # leave the documents to expire via their TTL
+                    await self.redis.execute_command("FT.DROPINDEX", name)
+                elif name != current and name.startswith(f"{legacy}:"):
+                    await self.redis.execute_command("FT.DROPINDEX", name, "DD")
+            except ResponseError:
+                pass  # Already dropped by another worker
+
+    async def search(
+        self,
+        namespace: str,
+        embedding: List[float],
+        threshold: float = SEMANTIC_CACHE_THRESHOLD
+    ) -> Optional[dict]:
+        """
+        Return the cached response for the nearest past query, if similar enough.
+
+        Args:
+            namespace: The swarm's cache namespace, from SemanticCache.namespace
+            embedding: The query embedding
+            threshold: Minimum cosine similarity for a hit
+
+        Returns:
+            The cached response dict, or None on a miss
+        """
+        try:
+            await self._ensure_index(namespace)
+            results = await self.redis.execute_command(
+                "FT.SEARCH", self._index_name(namespace),
+                "*=>[KNN 1 @embedding $vec AS distance]",
+                "PARAMS", 2, "vec", array("f", embedding).tobytes(),
+                "SORTBY", "distance",
+                "RETURN", 2, "distance", "payload",
+                "LIMIT", 0, 1,
+                "DIALECT", 2,
+            )
+        except RedisError:
+            return None
+
+        # Reply layout: [total, key, [field, value, ...]]
+        if not results or results[0] == 0:
+            return None
+
+        fields = dict(zip(results[2][::2], results[2][1::2]))
+        similarity = 1 - float(fields[b"distance"])
+        if similarity < threshold:
+            return None
+
+        return json.loads(fields[b"payload"])
+
+    async def set(self, namespace: str, embedding: List[float], value: dict) -> None:
+        """Store a swarm response under its query embedding."""
+        key = f"{self._index_name(namespace)}:{uuid.uuid4().hex}"
+        try:
+            await self._ensure_index(namespace)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={
+                    "payload": json.dumps(value),
+                    "embedding": array("f", embedding).tobytes()
+                })
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except RedisError:
+            pass  # Caching is best-effort
+
+
+# Shared Redis connection; None disables caching
+redis_client = Redis.from_url(REDIS_URL) if REDIS_URL else None
+
+semantic_cache = SemanticCache(redis_client) if redis_client else None
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace and lowercase so trivial variations share a key."""
+    return " ".join(text.split()).lower()
+
+
+def kv_cache(prefix: str, *key_parts: str, ttl: int = KV_CACHE_TTL):
+    """
+    Exact-match cache for async functions taking string arguments.
+
+    The key is a SHA-256 of the normalized static key parts (e.g. prompt and
+    model) followed by the positional call arguments. Keyword arguments (e.g. a
+    RunnableConfig) are passed through to the function but not keyed on.
+    Results are stored as JSON.
+
+    Args:
+        prefix: Redis key namespace (e.g., "supervisor")
+        key_parts: Static values that invalidate the cache when changed
+        ttl: Expiry in seconds
+    """
+    def decorator(fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        @functools.wraps(fn)
+        async def wrapper(*args: str, **kwargs):
+            if redis_client is None:
+                return await fn(*args, **kwargs)
+
+            digest = hashlib.sha256(
+                "\x00".join(_normalize(part) for part in (*key_parts, *args)).encode("utf-8")
+            ).hexdigest()
+            key = f"{prefix}:{digest}"
+
+            try:
+                cached = await redis_client.get(key)
+            except RedisError:
+                cached = None
+            if cached is not None:
+                return json.loads(cached)
+
+            result = await fn(*args, **kwargs)
+
+            try:
+                await redis_client.setex(key, ttl, json.dumps(result))
+            except RedisError:
+                pass  # Caching is best-effort
+
+            return result
+
+        return wrapper
+
+    return decorator
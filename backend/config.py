@@ -12,19 +12,34 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.parent
 EPISODES_DIR = BASE_DIR / "episodes"
 CHROMA_DB_DIR = BASE_DIR / "chroma_db"
+PERSONA_INDEX_DIR = BASE_DIR / "persona_index"  # Per-swarm HNSW indexes built from ChromaDB
+INGEST_CACHE_DIR = BASE_DIR / ".ingest_cache"  # Parsed transcript segments, reused across re-ingests
 
 # OpenAI
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 EMBEDDING_MODEL = "text-embedding-3-small"
-LLM_MODEL = "gpt-4o"
+SUPERVISOR_LLM_MODEL = "gpt-4o-mini"  # Mechanical query splitting; no need for the large model
+SWARM_LLM_MODEL = "gpt-4o"
+SYNTHESIZER_LLM_MODEL = "gpt-4o"
 
-# ChromaDB
-COLLECTION_NAME = "pm_council_transcripts"
+# ChromaDB (one collection per persona swarm, e.g. "pm_council_founder_swarm")
+COLLECTION_PREFIX = "pm_council_"
+
+# Redis cache (caching is disabled when REDIS_URL is unset)
+REDIS_URL = os.getenv("REDIS_URL")
+EMBEDDING_DIM = 1536  # text-embedding-3-small
+SEMANTIC_CACHE_THRESHOLD = 0.93  # cosine similarity required for a hit
+SEMANTIC_CACHE_TTL = 86400  # seconds
+KV_CACHE_TTL = 86400  # seconds
 
 # Chunking settings
 CHUNK_SIZE = 500  # tokens
 CHUNK_OVERLAP = 50  # tokens
 
+# Ingestion
+EMBEDDING_CONCURRENCY = 10  # embedding requests in flight at once
+EMBEDDING_BATCH_SIZE = 500  # chunks per embedding request and ChromaDB add (~250k tokens, under OpenAI's 300k cap)
+
 # Swarm configurations for the Quad-Swarm Engine
 SWARMS = {
     "founder_swarm": {
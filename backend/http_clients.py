@@ -0,0 +1,13 @@
+"""
+Shared HTTP clients for OpenAI calls.
+
+Every ChatOpenAI / OpenAIEmbeddings instance uses these so that the
+supervisor, swarms and synthesizer reuse one pool of warm TLS connections.
+"""
+
+import httpx
+
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+http_client = httpx.Client(limits=_LIMITS, timeout=60.0, http2=True)
+http_async_client = httpx.AsyncClient(limits=_LIMITS, timeout=60.0, http2=True)
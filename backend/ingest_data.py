@@ -3,118 +3,173 @@ Data ingestion script for PM High Council.
 Reads podcast transcripts, chunks them, and stores embeddings in ChromaDB.
 """
 
+import asyncio
+import functools
+import hashlib
+import mmap
+import multiprocessing
+import os
+import pickle
 import re
+import shutil
 import yaml
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, List, Dict, Tuple
+from typing import Any, Callable, Generator, Iterable, Iterator, List, Dict, Tuple
 
 import chromadb
+import tiktoken
 from chromadb.config import Settings
-from langchain_openai import OpenAIEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from openai import AsyncOpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+try:
+    from yaml import CSafeLoader as _YLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YLoader
 
 from config import (
     SWARMS,
     CHROMA_DB_DIR,
-    COLLECTION_NAME,
+    PERSONA_INDEX_DIR,
+    INGEST_CACHE_DIR,
+    COLLECTION_PREFIX,
     CHUNK_SIZE,
     CHUNK_OVERLAP,
     EMBEDDING_MODEL,
+    EMBEDDING_CONCURRENCY,
+    EMBEDDING_BATCH_SIZE,
     OPENAI_API_KEY,
 )
-from persona_mapping import get_persona_for_speaker, PERSONA_MAP
+from persona_mapping import get_persona_for_speaker, get_display_name_from_speaker, PERSONA_MAP
 
 
-def parse_transcript(file_path: Path) -> dict:
-    """Parse a markdown transcript file with YAML frontmatter."""
-    content = file_path.read_text(encoding="utf-8")
+# Speaker turn: "Speaker Name (HH:MM:SS):"
+_SPEAKER_RE = re.compile(r"^([A-Za-z][A-Za-z\- ]+) \((\d{2}:\d{2}:\d{2})\):\s*")
+# Mid-speech timestamp: "(HH:MM:SS):"
+_TS_RE = re.compile(r"^\((\d{2}:\d{2}:\d{2})\):\s*")
+# Speaker turn that ends a sponsor block
+_SPONSOR_END_RE = re.compile(r"^[A-Z][a-z]+ [A-Z]?[a-z]* ?\(\d{2}:\d{2}:\d{2}\):")
+# Trailing episode number on a folder name (e.g., "elena-verna-40")
+_EPNUM_RE = re.compile(r"-\d+$")
 
-    # Split frontmatter from content
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1])
-            body = parts[2].strip()
-        else:
+# Bump when parsing/segment extraction changes to invalidate the ingest cache
+_INGEST_CACHE_VERSION = 2
+
+# Chunk boundaries, coarsest first
+_SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
+def _iter_lines(mm: mmap.mmap, start: int) -> Iterator[str]:
+    """Yield decoded lines from a memory-mapped file, one at a time, starting at a byte offset."""
+    mm.seek(start)
+    for raw_line in iter(mm.readline, b""):
+        yield raw_line.rstrip(b"\n").decode("utf-8")
+
+
+@contextmanager
+def open_transcript(file_path: Path) -> Iterator[Tuple[dict, Iterator[str]]]:
+    """
+    Memory-map a markdown transcript and parse its YAML frontmatter.
+
+    Yields the frontmatter and an iterator over the body's lines. Lines are
+    decoded as they are consumed, so the body is never held as one string or
+    list of lines; the iterator is only valid inside the with block.
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield {}, iter(())
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Split frontmatter from content
             frontmatter = {}
-            body = content
-    else:
-        frontmatter = {}
-        body = content
-
-    return {
-        "metadata": frontmatter,
-        "body": body,
-        "source_file": str(file_path)
-    }
-
-
-def clean_transcript(body: str) -> str:
-    """Remove sponsor blocks and clean up transcript text."""
-    lines = body.split("\n")
-    cleaned_lines = []
-    in_sponsor_block = False
+            body_start = 0
+            if mm[:3] == b"---":
+                frontmatter_end = mm.find(b"---", 3)
+                if frontmatter_end != -1:
+                    frontmatter = yaml.load(mm[3:frontmatter_end].decode("utf-8"), Loader=_YLoader) or {}
+                    body_start = frontmatter_end + 3
 
-    for line in lines:
-        # Detect sponsor block start
-        if "This episode is brought to you by" in line:
-            in_sponsor_block = True
-            continue
+            yield frontmatter, _iter_lines(mm, body_start)
 
-        # Detect sponsor block end (next speaker)
-        if in_sponsor_block and re.match(r"^[A-Z][a-z]+ [A-Z]?[a-z]* ?\(\d{2}:\d{2}:\d{2}\):", line):
-            in_sponsor_block = False
 
-        if not in_sponsor_block:
-            cleaned_lines.append(line)
+@functools.lru_cache(maxsize=None)
+def _normalize_speaker(name: str) -> str:
+    """Normalize a speaker name for comparison (e.g., "Elena-Verna " -> "elena verna")."""
+    return name.lower().replace("-", " ").strip()
+
 
-    return "\n".join(cleaned_lines)
+def _speaker_aliases(target_speaker: str) -> frozenset:
+    """Normalized names that identify the target speaker: full, first, last and first-last."""
+    target_norm = _normalize_speaker(target_speaker)
+    parts = target_norm.split()
+    if not parts:
+        return frozenset({target_norm})
+    return frozenset({target_norm, parts[0], parts[-1], f"{parts[0]} {parts[-1]}"})
 
 
-def extract_speaker_segments(body: str, target_speaker: str) -> List[Dict]:
-    """Extract segments where the target speaker is talking."""
-    # Pattern to match speaker turns: "Speaker Name (HH:MM:SS):"
-    pattern = r"^([A-Za-z][A-Za-z\- ]+) \((\d{2}:\d{2}:\d{2})\):\s*"
+def parse_and_extract(lines: Iterable[str], target_speaker: str) -> List[Dict]:
+    """
+    Extract segments where the target speaker is talking, skipping sponsor blocks.
 
+    Sponsor removal and speaker segmentation run as one state machine over a
+    single pass of the lines.
+    """
     segments = []
     current_speaker = None
     current_timestamp = None
     current_text = []
+    in_sponsor_block = False
+    target_aliases = _speaker_aliases(target_speaker)
 
-    def normalize(name: str) -> str:
-        return name.lower().replace("-", " ").strip()
+    # Bind hot-loop attribute lookups to locals once instead of once per line
+    seg_append = segments.append
+    text_append = current_text.append
+    sponsor_end_match = _SPONSOR_END_RE.match
+    speaker_match = _SPEAKER_RE.match
+    ts_match = _TS_RE.match
 
-    for line in body.split("\n"):
-        match = re.match(pattern, line)
+    for line in lines:
+        # Detect sponsor block start
+        if "This episode is brought to you by" in line:
+            in_sponsor_block = True
+            continue
+
+        if in_sponsor_block:
+            # Detect sponsor block end (next speaker)
+            if not sponsor_end_match(line):
+                continue
+            in_sponsor_block = False
+
+        match = speaker_match(line)
         if match:
             # Save previous segment if it was from target speaker
             if current_speaker and current_text:
-                speaker_norm = normalize(current_speaker)
-                target_norm = normalize(target_speaker)
-                if target_norm in speaker_norm or speaker_norm in target_norm:
-                    segments.append({
+                if _normalize_speaker(current_speaker) in target_aliases:
+                    seg_append({
                         "speaker": current_speaker,
                         "timestamp": current_timestamp,
                         "text": "\n".join(current_text).strip()
                     })
 
             # Start new segment
-            current_speaker = match.group(1)
-            current_timestamp = match.group(2)
+            current_speaker, current_timestamp = match.groups()
             current_text = [line[match.end():]]
+            text_append = current_text.append
         else:
             # Check for mid-speech timestamp
-            timestamp_match = re.match(r"^\((\d{2}:\d{2}:\d{2})\):\s*", line)
+            timestamp_match = ts_match(line)
             if timestamp_match:
-                current_text.append(line[timestamp_match.end():])
+                text_append(line[timestamp_match.end():])
             else:
-                current_text.append(line)
+                text_append(line)
 
     # Don't forget last segment
     if current_speaker and current_text:
-        speaker_norm = normalize(current_speaker)
-        target_norm = normalize(target_speaker)
-        if target_norm in speaker_norm or speaker_norm in target_norm:
+        if _normalize_speaker(current_speaker) in target_aliases:
             segments.append({
                 "speaker": current_speaker,
                 "timestamp": current_timestamp,
@@ -124,23 +179,122 @@ def extract_speaker_segments(body: str, target_speaker: str) -> List[Dict]:
     return segments
 
 
+def load_segments(transcript_path: Path, target_speaker: str) -> Tuple[dict, List[Dict]]:
+    """
+    Parse a transcript and extract the target speaker's segments, with an on-disk cache.
+
+    Cache entries are keyed on the file's path, mtime and size, so unchanged
+    transcripts skip reading, YAML parsing and the regex scans on re-ingest.
+
+    Returns:
+        (frontmatter metadata, speaker segments) tuple
+    """
+    stat = transcript_path.stat()
+    key = (_INGEST_CACHE_VERSION, str(transcript_path), stat.st_mtime_ns, stat.st_size, target_speaker)
+    cache_path = INGEST_CACHE_DIR / f"{hashlib.sha1(str(transcript_path).encode('utf-8')).hexdigest()}.pkl"
+
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, metadata, segments = pickle.load(f)
+        if cached_key == key:
+            return metadata, segments
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache entry
+
+    # Parse and extract speaker segments in a single pass over the lines
+    with open_transcript(transcript_path) as (metadata, lines):
+        segments = parse_and_extract(lines, target_speaker)
+
+    # Write atomically so a crashed run never leaves a truncated entry
+    INGEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump((key, metadata, segments), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+    return metadata, segments
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding() -> "tiktoken.Encoding":
+    """Tokenizer for the embedding model, loaded once per process."""
+    return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+
+def _token_len(text: str) -> int:
+    """Number of embedding-model tokens in text."""
+    return len(_get_encoding().encode_ordinary(text))
+
+
+def _split_pieces(text: str, size: int, separators: Tuple[str, ...]) -> List[Tuple[str, int]]:
+    """
+    Split text into pieces of at most size tokens, using finer separators only where needed.
+
+    Returns:
+        (piece, token count) pairs, so callers never re-tokenize a piece
+    """
+    token_count = _token_len(text)
+    if token_count <= size:
+        return [(text, token_count)]
+
+    for i, separator in enumerate(separators):
+        if separator in text:
+            parts = text.split(separator)
+            pieces = []
+            # Keep each separator attached to the piece it ends
+            for part in [part + separator for part in parts[:-1]] + [parts[-1]]:
+                if part:
+                    pieces.extend(_split_pieces(part, size, separators[i + 1:]))
+            return pieces
+
+    # No separator left: hard split on token windows
+    encoding = _get_encoding()
+    tokens = encoding.encode_ordinary(text)
+    return [
+        (encoding.decode(tokens[i:i + size]), len(tokens[i:i + size]))
+        for i in range(0, len(tokens), size)
+    ]
+
+
+def _fast_chunk(text: str, size: int, overlap: int) -> List[str]:
+    """
+    Split text into chunks of at most size tokens, overlapping by up to overlap tokens.
+
+    Splits on paragraph breaks first, falling back to line, sentence and word
+    boundaries only for pieces still longer than size, then greedily packs
+    the pieces into chunks.
+    """
+    chunks = []
+    current = deque()  # (piece, token count) pairs
+    current_len = 0
+
+    for piece, piece_len in _split_pieces(text, size, _SEPARATORS):
+        if current and current_len + piece_len > size:
+            chunks.append("".join(p for p, _ in current))
+            # Carry trailing pieces over as the next chunk's overlap
+            while current and (current_len > overlap or current_len + piece_len > size):
+                current_len -= current.popleft()[1]
+
+        current.append((piece, piece_len))
+        current_len += piece_len
+
+    if current:
+        chunks.append("".join(p for p, _ in current))
+
+    return chunks
+
+
 def chunk_segments(
     segments: List[Dict],
     chunk_size: int = CHUNK_SIZE,
     chunk_overlap: int = CHUNK_OVERLAP
 ) -> Generator[dict, None, None]:
     """Chunk speaker segments into smaller pieces."""
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size * 4,  # Approximate tokens to chars
-        chunk_overlap=chunk_overlap * 4,
-        separators=["\n\n", "\n", ". ", " ", ""]
-    )
-
     for segment in segments:
         if not segment["text"].strip():
             continue
 
-        chunks = splitter.split_text(segment["text"])
+        chunks = _fast_chunk(segment["text"], chunk_size, chunk_overlap)
         for i, chunk in enumerate(chunks):
             if chunk.strip():
                 yield {
@@ -151,11 +305,6 @@ def chunk_segments(
                 }
 
 
-def get_display_name_from_speaker(speaker_name: str) -> str:
-    """Convert speaker slug to display name (e.g., 'brian-chesky' -> 'Brian Chesky')."""
-    return " ".join(word.capitalize() for word in speaker_name.split("-"))
-
-
 def find_all_transcripts(episodes_dir: Path) -> List[Tuple[Path, str]]:
     """
     Find all transcript files and their associated speakers.
@@ -168,60 +317,196 @@ def find_all_transcripts(episodes_dir: Path) -> List[Tuple[Path, str]]:
     if not episodes_dir.exists():
         return transcripts
 
-    for episode_folder in episodes_dir.iterdir():
-        if not episode_folder.is_dir():
-            continue
+    # DirEntry.is_dir() uses the type from the directory listing, avoiding a stat per entry
+    with os.scandir(episodes_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
 
-        transcript_path = episode_folder / "transcript.md"
-        if not transcript_path.exists():
-            continue
+            transcript_path = os.path.join(entry.path, "transcript.md")
+            if not os.path.isfile(transcript_path):
+                continue
 
-        # Extract speaker name from folder (e.g., "elena-verna-40" -> "elena-verna")
-        folder_name = episode_folder.name
-        # Remove trailing numbers (episode numbers)
-        speaker_name = re.sub(r'-\d+$', '', folder_name)
+            # Extract speaker name from folder (e.g., "elena-verna-40" -> "elena-verna")
+            # Remove trailing numbers (episode numbers)
+            speaker_name = _EPNUM_RE.sub("", entry.name)
 
-        transcripts.append((transcript_path, speaker_name))
+            transcripts.append((Path(transcript_path), speaker_name))
 
     return transcripts
 
 
-def ingest_transcripts():
-    """Main ingestion function for the Quad-Swarm Engine."""
-    print("Starting transcript ingestion for Quad-Swarm Engine...")
-    print(f"Looking for transcripts in: {Path(__file__).parent.parent / 'episodes'}")
+def _process_transcript(task: Tuple[Path, str, str]) -> List[Tuple[str, Dict, str]]:
+    """
+    Parse, clean, segment and chunk one transcript.
 
-    # Initialize ChromaDB
-    CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+        task: (transcript_path, speaker_name, persona) tuple
 
-    client = chromadb.PersistentClient(
+    Returns:
+        List of (text, metadata, id) tuples
+    """
+    transcript_path, speaker_name, persona = task
+    display_name = get_display_name_from_speaker(speaker_name)
+
+    # Parse and extract speaker segments (cached across re-ingests)
+    metadata, segments = load_segments(transcript_path, display_name)
+
+    # Chunk segments
+    results = []
+    episode_folder = transcript_path.parent.name
+    for chunk in chunk_segments(segments):
+        text = chunk["text"]
+
+        # Content-addressed ID, so unchanged chunks keep their ID across re-ingests
+        doc_id = hashlib.sha1(f"{episode_folder}\x00{text}".encode("utf-8")).hexdigest()
+
+        results.append((text, {
+            "speaker_name": speaker_name,
+            "persona": persona,  # NEW: swarm identifier
+            "guest": display_name,
+            "episode_title": metadata.get("title", "Unknown"),
+            "timestamp": chunk["timestamp"],
+            "chunk_index": chunk["chunk_index"],
+            "source_file": str(transcript_path),
+            "preview": text[:200] + "..." if len(text) > 200 else text
+        }, doc_id))
+
+    return results
+
+
+@functools.cache
+def _get_client():
+    """Open the ChromaDB client once and reuse it across ingests."""
+    CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+    return chromadb.PersistentClient(
         path=str(CHROMA_DB_DIR),
         settings=Settings(anonymized_telemetry=False)
     )
 
-    # Delete existing collection if it exists
-    try:
-        client.delete_collection(COLLECTION_NAME)
-        print(f"Deleted existing collection: {COLLECTION_NAME}")
-    except Exception:
-        pass  # Collection doesn't exist yet
-
-    # Create new collection
-    collection = client.create_collection(
-        name=COLLECTION_NAME,
-        metadata={"hnsw:space": "cosine"}
-    )
-    print(f"Created collection: {COLLECTION_NAME}")
 
-    # Initialize embeddings
-    embeddings = OpenAIEmbeddings(
-        model=EMBEDDING_MODEL,
-        openai_api_key=OPENAI_API_KEY
-    )
+def _bounded_map(
+    executor: ProcessPoolExecutor,
+    fn: Callable,
+    tasks: Iterable,
+    window: int
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Like executor.map, but submits at most window tasks ahead of the consumer.
+
+    Yields (task, result) pairs in task order, so results never pile up
+    faster than they are consumed.
+    """
+    submitted = deque()
+    for task in tasks:
+        submitted.append((task, executor.submit(fn, task)))
+        if len(submitted) >= window:
+            task, future = submitted.popleft()
+            yield task, future.result()
+
+    while submitted:
+        task, future = submitted.popleft()
+        yield task, future.result()
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to size items (itertools.batched needs Python 3.12)."""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def upsert_to_collections(
+    collections: Dict[str, "chromadb.Collection"],
+    documents: List[str],
+    embeddings: List[List[float]],
+    metadatas: List[Dict],
+    ids: List[str]
+) -> None:
+    """Upsert a batch of embedded chunks, routing each to its persona's collection."""
+    by_persona = {}
+    for doc, embedding, meta, doc_id in zip(documents, embeddings, metadatas, ids):
+        rows = by_persona.setdefault(meta["persona"], ([], [], [], []))
+        rows[0].append(doc)
+        rows[1].append(embedding)
+        rows[2].append(meta)
+        rows[3].append(doc_id)
+
+    for persona, (docs, embs, metas, doc_ids) in by_persona.items():
+        collections[persona].upsert(
+            documents=docs,
+            embeddings=embs,
+            metadatas=metas,
+            ids=doc_ids
+        )
+
+
+def refresh_metadatas(
+    collection: "chromadb.Collection",
+    ids: List[str],
+    metadatas: List[Dict]
+) -> int:
+    """
+    Update stored metadata for already-embedded chunks where it differs.
 
-    all_documents = []
-    all_metadatas = []
-    all_ids = []
+    Only this batch's stored metadata is fetched, and embeddings are untouched.
+
+    Returns:
+        Number of chunks updated
+    """
+    stored = collection.get(ids=ids, include=["metadatas"])
+    stored_by_id = dict(zip(stored["ids"], stored["metadatas"]))
+
+    changed = [(doc_id, meta) for doc_id, meta in zip(ids, metadatas) if stored_by_id.get(doc_id) != meta]
+    if changed:
+        changed_ids, changed_metadatas = zip(*changed)
+        collection.update(ids=list(changed_ids), metadatas=list(changed_metadatas))
+
+    return len(changed)
+
+
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(6)
+)
+async def embed_batch(
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    documents: List[str]
+) -> List[List[float]]:
+    """Embed one batch of documents, holding a semaphore slot while in flight."""
+    async with semaphore:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=documents)
+    return [item.embedding for item in response.data]
+
+
+async def ingest_transcripts():
+    """Main ingestion function for the Quad-Swarm Engine."""
+    print("Starting transcript ingestion for Quad-Swarm Engine...")
+    print(f"Looking for transcripts in: {Path(__file__).parent.parent / 'episodes'}")
+
+    client = _get_client()
+
+    # One collection per persona swarm, so retrieval needs no metadata filter.
+    # Existing collections are kept so unchanged chunks are not re-embedded.
+    collections = {}
+    existing_ids = {}
+    for persona in PERSONA_MAP:
+        collection_name = f"{COLLECTION_PREFIX}{persona}"
+        collections[persona] = client.get_or_create_collection(
+            name=collection_name,
+            metadata={"hnsw:space": "cosine"}
+        )
+        existing_ids[persona] = set(collections[persona].get(include=[])["ids"])
+        print(f"Opened collection: {collection_name} ({len(existing_ids[persona])} existing chunks)")
 
     # Find all transcripts
     episodes_dir = Path(__file__).parent.parent / "episodes"
@@ -233,79 +518,141 @@ def ingest_transcripts():
     persona_stats = {persona: 0 for persona in PERSONA_MAP.keys()}
     skipped_speakers = set()
 
-    # Process each transcript
+    # IDs of every chunk in the current corpus, per persona
+    current_ids = {persona: set() for persona in PERSONA_MAP.keys()}
+
+    # (id, metadata) of already-embedded chunks awaiting a metadata check, per
+    # persona; flushed every EMBEDDING_BATCH_SIZE so memory stays bounded
+    unchanged = {persona: [] for persona in PERSONA_MAP.keys()}
+    refreshed = {persona: 0 for persona in PERSONA_MAP.keys()}
+
+    # Keep only transcripts whose speaker is in a persona swarm
+    tasks = []
     for transcript_path, speaker_name in transcripts:
-        # Check if speaker is in a persona swarm
         persona = get_persona_for_speaker(speaker_name)
 
         if persona is None:
             skipped_speakers.add(speaker_name)
             continue
 
-        display_name = get_display_name_from_speaker(speaker_name)
-        print(f"\nProcessing {display_name} ({persona})...")
-        print(f"  Reading: {transcript_path}")
-
-        # Parse transcript
-        parsed = parse_transcript(transcript_path)
-
-        # Clean transcript
-        cleaned_body = clean_transcript(parsed["body"])
-
-        # Extract speaker segments
-        segments = extract_speaker_segments(cleaned_body, display_name)
-        print(f"    Found {len(segments)} segments from {display_name}")
-
-        # Chunk segments
-        chunk_count = 0
-        episode_folder = transcript_path.parent.name
-        for chunk in chunk_segments(segments):
-            doc_id = f"{speaker_name}_{episode_folder}_{chunk_count}"
-
-            all_documents.append(chunk["text"])
-            all_metadatas.append({
-                "speaker_name": speaker_name,
-                "persona": persona,  # NEW: swarm identifier
-                "guest": display_name,
-                "episode_title": parsed["metadata"].get("title", "Unknown"),
-                "timestamp": chunk["timestamp"],
-                "chunk_index": chunk["chunk_index"],
-                "source_file": str(transcript_path)
-            })
-            all_ids.append(doc_id)
-            chunk_count += 1
-
-        persona_stats[persona] += chunk_count
-        print(f"    Created {chunk_count} chunks")
-
-    # Generate embeddings and add to collection
-    if all_documents:
-        print(f"\nGenerating embeddings for {len(all_documents)} chunks...")
-
-        # Process in batches to avoid rate limits
-        batch_size = 100
-        for i in range(0, len(all_documents), batch_size):
-            batch_docs = all_documents[i:i + batch_size]
-            batch_metas = all_metadatas[i:i + batch_size]
-            batch_ids = all_ids[i:i + batch_size]
-
-            # Generate embeddings
-            batch_embeddings = embeddings.embed_documents(batch_docs)
-
-            # Add to collection
-            collection.add(
-                documents=batch_docs,
-                embeddings=batch_embeddings,
-                metadatas=batch_metas,
-                ids=batch_ids
-            )
-
-            print(f"  Added batch {i // batch_size + 1}/{(len(all_documents) - 1) // batch_size + 1}")
+        tasks.append((transcript_path, speaker_name, persona))
+
+    def refresh_unchanged(persona: str) -> None:
+        """
+        Refresh metadata for a persona's buffered unchanged chunks, then clear the buffer.
+
+        Called from iter_chunks, whose batches are pulled one at a time, so these
+        ChromaDB calls never overlap the batch upserts.
+        """
+        buffered = unchanged[persona]
+        if buffered:
+            ids, metadatas = zip(*buffered)
+            refreshed[persona] += refresh_metadatas(collections[persona], list(ids), list(metadatas))
+            buffered.clear()
+
+    def iter_chunks(executor: ProcessPoolExecutor) -> Iterator[Tuple[str, Dict, str]]:
+        """Yield (text, metadata, id) for each chunk not already in ChromaDB, one transcript at a time."""
+        window = 2 * (os.cpu_count() or 1)
+        for (transcript_path, speaker_name, persona), chunks in _bounded_map(executor, _process_transcript, tasks, window):
+            print(f"\nProcessed {get_display_name_from_speaker(speaker_name)} ({persona}): {transcript_path}")
+
+            for text, metadata, doc_id in chunks:
+                # Skip repeated chunks and chunks already embedded by a previous run
+                if doc_id in current_ids[persona]:
+                    continue
+                current_ids[persona].add(doc_id)
+
+                if doc_id in existing_ids[persona]:
+                    # Same text, so the stored embedding is still valid; only
+                    # refresh metadata (e.g. an edited episode title)
+                    unchanged[persona].append((doc_id, metadata))
+                    if len(unchanged[persona]) >= EMBEDDING_BATCH_SIZE:
+                        refresh_unchanged(persona)
+                    continue
+
+                yield text, metadata, doc_id
+
+            persona_stats[persona] += len(chunks)
+            print(f"    Created {len(chunks)} chunks")
+
+    # Embed up to EMBEDDING_CONCURRENCY batches at once and upsert them in order
+    # as they finish, so network-bound embedding overlaps the disk/CPU-bound HNSW
+    # inserts. A new batch is only pulled from the chunk stream once there is room,
+    # so memory holds a bounded window of batches however large the corpus is.
+    semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+    pending = deque()
+    added_batches = 0
+    added_chunks = 0
+
+    async def write_oldest() -> None:
+        nonlocal added_batches, added_chunks
+        batch, embedding_task = pending.popleft()
+        batch_embeddings = await embedding_task
+
+        texts, metadatas, ids = zip(*batch)
+        await asyncio.to_thread(
+            upsert_to_collections,
+            collections,
+            list(texts),
+            batch_embeddings,
+            list(metadatas),
+            list(ids)
+        )
+
+        added_batches += 1
+        added_chunks += len(batch)
+        print(f"  Added batch {added_batches} ({len(batch)} chunks)")
+
+    # The AsyncOpenAI connection pool is bound to the running event loop, so the
+    # client lives only for this ingest and is closed before asyncio.run returns
+    async with AsyncOpenAI(api_key=OPENAI_API_KEY) as openai_client:
+        # Parse and chunk transcripts in parallel (CPU-bound); ChromaDB writes stay in this process.
+        # Workers start on the first submit, from an asyncio.to_thread worker, so spawn
+        # them: forking this multi-threaded process can deadlock the children
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+            batches = _batched(iter_chunks(executor), EMBEDDING_BATCH_SIZE)
+            while True:
+                # Pull the next batch off the event loop while parsing workers catch up
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch is None:
+                    break
+
+                if len(pending) >= EMBEDDING_CONCURRENCY:
+                    await write_oldest()
+
+                pending.append((batch, asyncio.create_task(
+                    embed_batch(openai_client, semaphore, [text for text, _, _ in batch])
+                )))
+
+        while pending:
+            await write_oldest()
+
+    if added_chunks:
+        print(f"\nEmbedded {added_chunks} new chunks")
+
+    # Check the last partial batches of unchanged chunks; no embedding call
+    for persona in PERSONA_MAP:
+        refresh_unchanged(persona)
+        if refreshed[persona]:
+            print(f"Refreshed metadata for {refreshed[persona]} chunks in {persona}")
+
+    # Prune chunks whose transcript text changed or was removed; needs the full
+    # corpus seen, so this runs after the stream is drained
+    for persona, collection in collections.items():
+        stale_ids = existing_ids[persona] - current_ids[persona]
+        if stale_ids:
+            collection.delete(ids=list(stale_ids))
+            print(f"Removed {len(stale_ids)} stale chunks from {persona}")
+
+    # Persona HNSW indexes are derived from the collections; rebuild on next startup.
+    # Cleared only once the collections are final, so an index a server built
+    # from a half-written collection mid-ingest is discarded too
+    shutil.rmtree(PERSONA_INDEX_DIR, ignore_errors=True)
 
     print(f"\n{'='*50}")
     print("INGESTION COMPLETE")
     print(f"{'='*50}")
-    print(f"Total documents: {collection.count()}")
+    print(f"Total documents: {sum(collection.count() for collection in collections.values())}")
 
     # Print summary by persona swarm
     print("\nChunks by Persona Swarm:")
@@ -326,4 +673,4 @@ def ingest_transcripts():
 
 
 if __name__ == "__main__":
-    ingest_transcripts()
+    asyncio.run(ingest_transcripts())
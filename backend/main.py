@@ -2,16 +2,17 @@
 FastAPI backend for PM High Council's Quad-Swarm Engine.
 """
 
-import json
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Optional, List, Dict
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from sse_starlette.sse import EventSourceResponse
 
-from agent_graph import invoke_council, stream_council
+from agent_graph import ainvoke_council, get_council_graph, stream_council
 from config import SWARMS
 
 
@@ -41,6 +42,8 @@ class CouncilResponse(BaseModel):
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     print("PM High Council Quad-Swarm Engine starting...")
+    # Build the graph (and warm the persona indexes) before the first request
+    await asyncio.to_thread(get_council_graph)
     yield
     print("PM High Council Quad-Swarm Engine shutting down...")
 
@@ -49,7 +52,8 @@ app = FastAPI(
     title="PM High Council API",
     description="Quad-Swarm advisory system powered by collective product leadership wisdom",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
@@ -89,7 +93,7 @@ async def convene_council(request: ProblemRequest):
         raise HTTPException(status_code=400, detail="Problem statement cannot be empty")
 
     try:
-        result = invoke_council(request.problem)
+        result = await ainvoke_council(request.problem)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -103,6 +107,7 @@ async def stream_council_response(request: ProblemRequest):
     Events:
     - swarm_start: {"swarm": "founder_swarm|product_swarm|growth_swarm|engineering_swarm", "display_name": "..."}
     - swarm_complete: {"swarm": "...", "display_name": "...", "response": {...}}
+    - synthesis_token: {"token": "..."}
     - synthesis_complete: {"synthesis": "..."}
     - done: {}
     """
@@ -110,19 +115,19 @@ async def stream_council_response(request: ProblemRequest):
         raise HTTPException(status_code=400, detail="Problem statement cannot be empty")
 
     async def event_generator():
+        # Frames are formatted straight to bytes; synthesis tokens make this the hottest path
+        dumps = orjson.dumps
         try:
             async for event in stream_council(request.problem):
-                yield {
-                    "event": event["event"],
-                    "data": json.dumps(event["data"])
-                }
+                yield b"event: %s\ndata: %s\n\n" % (event["event"].encode(), dumps(event["data"]))
         except Exception as e:
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": str(e)})
-            }
+            yield b"event: error\ndata: %s\n\n" % dumps({"error": str(e)})
 
-    return EventSourceResponse(event_generator())
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.get("/api/health")
@@ -4,27 +4,49 @@ Persona Mapping for the Quad-Swarm Engine
 Maps individual speakers to their respective persona swarms.
 """
 
-from typing import Optional, List
+from typing import Optional, Tuple
 
+# Persona swarm -> speakers (frozensets: immutable, O(1) membership)
 PERSONA_MAP = {
-    "founder_swarm": [
+    "founder_swarm": frozenset({
         "brian-chesky", "tobi-lutke", "marc-benioff", "dylan-field",
         "stewart-butterfield", "ben-horowitz", "nikita-bier", "kunal-shah"
-    ],
-    "product_swarm": [
+    }),
+    "product_swarm": frozenset({
         "marty-cagan", "shreyas-doshi", "julie-zhuo", "gibson-biddle",
         "tomer-cohen", "noam-lovinsky", "lenny-rachitsky"
-    ],
-    "growth_swarm": [
+    }),
+    "growth_swarm": frozenset({
         "elena-verna", "brian-balfour", "casey-winters", "sean-ellis",
         "ayo-omojola", "sri-batchu", "patrick-campbell"
-    ],
-    "engineering_swarm": [
+    }),
+    "engineering_swarm": frozenset({
         "will-larson", "camille-fournier", "david-singleton", "farhan-thawar",
         "dhanji-r-prasanna", "chip-huyen", "geoff-charles"
-    ]
+    })
 }
 
+# Speaker -> persona swarm reverse index
+_SPEAKER_TO_PERSONA = {
+    speaker: persona
+    for persona, speakers in PERSONA_MAP.items()
+    for speaker in speakers
+}
+
+
+def _format_display_name(speaker_name: str) -> str:
+    """Format a speaker slug for display (e.g., 'brian-chesky' -> 'Brian Chesky')."""
+    return " ".join(word.capitalize() for word in speaker_name.split("-"))
+
+
+# Every mapped speaker and each swarm's speakers, sorted into tuples once so
+# callers get a stable order without re-sorting on every call
+_ALL = tuple(sorted(_SPEAKER_TO_PERSONA))
+_SPEAKERS_BY_PERSONA = {persona: tuple(sorted(speakers)) for persona, speakers in PERSONA_MAP.items()}
+
+# Speaker -> display name, precomputed for every mapped speaker
+_DISPLAY_NAMES = {speaker: _format_display_name(speaker) for speaker in _SPEAKER_TO_PERSONA}
+
 
 def get_persona_for_speaker(speaker_name: str) -> Optional[str]:
     """
@@ -36,25 +58,27 @@ def get_persona_for_speaker(speaker_name: str) -> Optional[str]:
     Returns:
         The persona swarm name (e.g., "founder_swarm") or None if not found
     """
-    for persona, speakers in PERSONA_MAP.items():
-        if speaker_name in speakers:
-            return persona
-    return None
+    return _SPEAKER_TO_PERSONA.get(speaker_name)
+
+
+def get_display_name_from_speaker(speaker_name: str) -> str:
+    """Convert speaker slug to display name (e.g., 'brian-chesky' -> 'Brian Chesky')."""
+    return _DISPLAY_NAMES.get(speaker_name) or _format_display_name(speaker_name)
 
 
-def get_all_speakers() -> List[str]:
-    """Returns a flat list of all mapped speakers across all swarms."""
-    return [speaker for speakers in PERSONA_MAP.values() for speaker in speakers]
+def get_all_speakers() -> Tuple[str, ...]:
+    """Returns a flat, sorted tuple of all mapped speakers across all swarms."""
+    return _ALL
 
 
-def get_speakers_for_persona(persona: str) -> List[str]:
+def get_speakers_for_persona(persona: str) -> Tuple[str, ...]:
     """
-    Returns the list of speakers for a given persona swarm.
+    Returns the sorted speakers for a given persona swarm.
 
     Args:
         persona: The persona swarm name (e.g., "founder_swarm")
 
     Returns:
-        List of speaker identifiers, or empty list if persona not found
+        Tuple of speaker identifiers, or empty tuple if persona not found
     """
-    return PERSONA_MAP.get(persona, [])
+    return _SPEAKERS_BY_PERSONA.get(persona, ())
@@ -29,6 +29,7 @@ export interface StreamEvent {
     display_name?: string;
     response?: SwarmResponse;
     synthesis?: string;
+    token?: string;
     error?: string;
   };
 }